@@ -4,7 +4,30 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Connection-pool tuning appended to the configured Mongo URI so each worker
+# keeps warm sockets instead of churning connections under concurrent load.
+_MONGO_POOL_OPTIONS = (
+    'maxPoolSize=50&minPoolSize=10&socketTimeoutMS=5000'
+    '&serverSelectionTimeoutMS=3000&waitQueueTimeoutMS=2000'
+)
+
+def _with_pool_options(uri):
+    if not uri:
+        return uri
+    separator = '&' if '?' in uri else '?'
+    return f'{uri}{separator}{_MONGO_POOL_OPTIONS}'
+
 class Config:
     DEBUG = True
     SECRET_KEY = os.getenv('SECRET_KEY')
-    MONGO_URI = os.getenv('MONGODB_URI')
\ No newline at end of file
+    MONGO_URI = _with_pool_options(os.getenv('MONGODB_URI'))
+    # Response cache for blog reads. Redis is used when REDIS_URL is set;
+    # otherwise an in-process SimpleCache, so dev servers and the test suite
+    # work without a Redis server. CACHE_TYPE can still be overridden
+    # explicitly (e.g. to 'NullCache' to disable caching altogether).
+    CACHE_TYPE = os.getenv(
+        'CACHE_TYPE',
+        'RedisCache' if os.getenv('REDIS_URL') else 'SimpleCache'
+    )
+    CACHE_REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+    CACHE_DEFAULT_TIMEOUT = 60
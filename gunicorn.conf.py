@@ -0,0 +1,17 @@
+"""Gunicorn configuration for production deployments.
+
+Run with:
+
+    gunicorn -c gunicorn.conf.py app:app
+
+Gevent workers let slow password hashing and Mongo I/O on one request
+overlap with other requests, which the single-threaded Flask dev server
+cannot do. The app is imported after each worker forks (no preload_app),
+so every worker gets its own PyMongo client and connection pool.
+"""
+import multiprocessing
+
+bind = '0.0.0.0:8000'
+worker_class = 'gevent'
+workers = multiprocessing.cpu_count()
+worker_connections = 1000